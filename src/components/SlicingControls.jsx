@@ -24,7 +24,7 @@ const SlicingControls = ({ sliceConfig, onSliceChange, bounds }) => {
       newConfig[axis] = { ...sliceConfig[axis], [property]: newValue };
     }
     
-    console.log(`🔧 Updating ${axis} ${property} to ${newValue}`);
+    console.log('🔧 Updating %s %s to %s', axis, property, newValue);
     onSliceChange(newConfig);
   };
 
@@ -39,7 +39,7 @@ const SlicingControls = ({ sliceConfig, onSliceChange, bounds }) => {
         min: bounds[axisIndex],
         max: bounds[axisIndex + 1]
       };
-      console.log(`✅ Enabling ${axis} axis with full range`);
+      console.log('✅ Enabling %s axis with full range', axis);
     } else {
       // When disabling, turn off clipping completely
       newConfig[axis] = {
@@ -47,7 +47,7 @@ const SlicingControls = ({ sliceConfig, onSliceChange, bounds }) => {
         min: bounds[axisIndex],
         max: bounds[axisIndex + 1]
       };
-      console.log(`❌ Disabling ${axis} axis - clearing clipping`);
+      console.log('❌ Disabling %s axis - clearing clipping', axis);
     }
     
     // Immediate update
@@ -64,7 +64,7 @@ const SlicingControls = ({ sliceConfig, onSliceChange, bounds }) => {
         max: bounds[axisIndex + 1]
       }
     };
-    console.log(`🔄 Resetting ${axis} axis - disabling clipping`);
+    console.log('🔄 Resetting %s axis - disabling clipping', axis);
     
     // Immediate update
     onSliceChange(newConfig);
@@ -1,7 +1,10 @@
-import React, { useEffect, useRef, useState } from 'react';
+import React, { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import { loadVtkFile } from '../utils/vtkUtils';
 import visualizationPalette from '../utils/visualizationPalette';
 
+// Dataset shown when no file has been uploaded
+const DEFAULT_VTK_FILE = '/Topology.vtk';
+
 const VtkRenderer = ({ 
   backgroundColor, 
   objectColor, 
@@ -19,6 +22,7 @@ const VtkRenderer = ({
   fileSource // New prop: either file path string or File object
 }) => {
   const vtkContainerRef = useRef(null);
+  const colorFuncRef = useRef(null); // Reused across palette/array changes
   const [renderWindow, setRenderWindow] = useState(null);
   const [renderer, setRenderer] = useState(null);
   const [actor, setActor] = useState(null);
@@ -28,6 +32,28 @@ const VtkRenderer = ({
   const [availableArrays, setAvailableArrays] = useState([]);
   const [lookupTable, setLookupTable] = useState(null);
 
+  // Coalesce render requests: slider bursts render at most once per animation frame
+  const renderFrameRef = useRef(null);
+  const requestRender = useCallback(() => {
+    if (!renderWindow || renderFrameRef.current !== null) return;
+    renderFrameRef.current = requestAnimationFrame(() => {
+      renderFrameRef.current = null;
+      renderWindow.render();
+    });
+  }, [renderWindow]);
+
+  useEffect(() => () => {
+    if (renderFrameRef.current !== null) {
+      cancelAnimationFrame(renderFrameRef.current);
+    }
+  }, []);
+
+  // Index data arrays by name so color mapping doesn't rescan the list
+  const arraysByName = useMemo(
+    () => new Map(availableArrays.map(arr => [arr.name, arr])),
+    [availableArrays]
+  );
+
   // Helper function to add synthetic data arrays to polyData
   const addSyntheticDataArrays = async (polyData, stats) => {
     try {
@@ -203,7 +229,7 @@ const VtkRenderer = ({
         setRenderWindow(renderWindowInstance);
 
         // Load VTK file
-        const fileToLoad = fileSource || '/Topology.vtk';
+        const fileToLoad = fileSource || DEFAULT_VTK_FILE;
         console.log('Loading VTK file:', fileToLoad instanceof File ? fileToLoad.name : fileToLoad);
         const { polyData: loadedPolyData, stats } = await loadVtkFile(fileToLoad);
         console.log('VTK file loaded:', stats);
@@ -408,13 +434,13 @@ const VtkRenderer = ({
                       const array = pointData.getArrayByName(arr.name);
                       if (array) {
                         value = array.getData()[pointId];
-                        console.log(`📊 Found real ${arr.name} value: ${value}`);
+                        console.log('📊 Found real %s value: %s', arr.name, value);
                       }
                     } else if (arr.type === 'cell' && cellId >= 0 && cellData) {
                       const array = cellData.getArrayByName(arr.name);
                       if (array) {
                         value = array.getData()[cellId];
-                        console.log(`📊 Found real ${arr.name} value: ${value}`);
+                        console.log('📊 Found real %s value: %s', arr.name, value);
                       }
                     }
                     
@@ -429,7 +455,7 @@ const VtkRenderer = ({
                       } else if (arr.name === 'Velocity') {
                         dataValues[arr.name] = Math.random() * 25;
                       }
-                      console.log(`📊 Using simulated ${arr.name} value: ${dataValues[arr.name]}`);
+                      console.log('📊 Using simulated %s value: %s', arr.name, dataValues[arr.name]);
                     }
                   });
                 } else {
@@ -582,18 +608,18 @@ const VtkRenderer = ({
           console.log('🧹 CLEARED all clipping planes - object should be fully visible');
         }
         
-        // Force render
-        if (renderWindow) {
-          renderWindow.render();
-        }
+        requestRender();
       }
     } catch (error) {
       console.error('❌ Error with clipping planes:', error);
     }
-  }, [sliceConfig, mapper, clippingPlanes, renderWindow, actor]);
+  }, [sliceConfig, mapper, clippingPlanes, actor, requestRender]);
 
   // Update color mapping when data array or color map changes
   useEffect(() => {
+    // Latest-only: a newer selection supersedes any run still awaiting
+    let isStale = false;
+
     const applyColorMapping = async () => {
       if (!mapper || !polyData || !actor) {
         console.log('⚠️ Mapper, polyData or actor not ready for color mapping');
@@ -607,28 +633,33 @@ const VtkRenderer = ({
         mapper.setLookupTable(null);
         actor.getProperty().setColor(...objectColor);
         
-        if (renderWindow) {
-          renderWindow.render();
-        }
+        requestRender();
         return;
       }
 
       try {
         // Find the selected data array
-        const dataArray = availableArrays.find(arr => arr.name === selectedDataArray);
+        const dataArray = arraysByName.get(selectedDataArray);
         if (!dataArray || !dataArray.data) {
           console.log('❌ Data array not found:', selectedDataArray);
           return;
         }
 
-        console.log(`🌈 Applying visualization palette: ${selectedDataArray} with ${paletteSelection}`);
+        console.log('🌈 Applying visualization palette: %s with %s', selectedDataArray, paletteSelection);
         console.log('📊 Data array info:', dataArray);
 
-        // Load VTK modules
-        const { default: vtkColorTransferFunction } = await import('@kitware/vtk.js/Rendering/Core/ColorTransferFunction');
-
-        // Create color transfer function using our original visualization palette system
-        const colorFunc = vtkColorTransferFunction.newInstance();
+        // Create the color transfer function once, then only swap its points
+        let colorFunc = colorFuncRef.current;
+        if (!colorFunc) {
+          const { default: vtkColorTransferFunction } = await import('@kitware/vtk.js/Rendering/Core/ColorTransferFunction');
+          colorFunc = vtkColorTransferFunction.newInstance();
+          colorFuncRef.current = colorFunc;
+          if (isStale) {
+            return;
+          }
+        } else {
+          colorFunc.removeAllPoints();
+        }
         const range = dataArray.range;
         
         console.log('📈 Data range:', range);
@@ -660,12 +691,9 @@ const VtkRenderer = ({
         // Enable scalar visibility
         mapper.setScalarVisibility(true);
         
-        console.log(`✅ Successfully applied ${paletteSelection} visualization palette to ${selectedDataArray}`);
+        console.log('✅ Successfully applied %s visualization palette to %s', paletteSelection, selectedDataArray);
         
-        // Force render
-        if (renderWindow) {
-          renderWindow.render();
-        }
+        requestRender();
 
       } catch (error) {
         console.error('❌ Error in color mapping:', error);
@@ -677,15 +705,17 @@ const VtkRenderer = ({
           actor.getProperty().setColor(...objectColor);
         }
         
-        if (renderWindow) {
-          renderWindow.render();
-        }
+        requestRender();
       }
     };
 
     // Apply color mapping
     applyColorMapping();
-  }, [selectedDataArray, paletteSelection, mapper, polyData, availableArrays, objectColor, actor, renderWindow]);
+
+    return () => {
+      isStale = true;
+    };
+  }, [selectedDataArray, paletteSelection, mapper, polyData, availableArrays, arraysByName, objectColor, actor, requestRender]);
 
   // Update visualization when properties change
   useEffect(() => {
@@ -705,8 +735,8 @@ const VtkRenderer = ({
     property.setRepresentation(wireframeMode ? 0 : 2);
     
     renderer.setBackground(...backgroundColor);
-    renderWindow.render();
-  }, [backgroundColor, objectColor, pointSize, opacity, wireframeMode, actor, renderer, renderWindow, selectedDataArray, availableArrays]);
+    requestRender();
+  }, [backgroundColor, objectColor, pointSize, opacity, wireframeMode, actor, renderer, renderWindow, requestRender, selectedDataArray, availableArrays]);
 
   return (
     <div 
@@ -2,6 +2,17 @@ import React, { useState } from 'react';
 import VtkRenderer from './VtkRenderer';
 import SlicingControls from './SlicingControls';
 
+// Camera placement per preset: position as a multiple of the view distance, plus view-up
+const CAMERA_PRESETS = {
+  front: { direction: [0, 0, 1], viewUp: [0, 1, 0] },
+  back: { direction: [0, 0, -1], viewUp: [0, 1, 0] },
+  left: { direction: [1, 0, 0], viewUp: [0, 0, 1] },
+  right: { direction: [-1, 0, 0], viewUp: [0, 0, 1] },
+  top: { direction: [0, 1, 0], viewUp: [0, 0, 1] },
+  bottom: { direction: [0, -1, 0], viewUp: [0, 0, 1] },
+  isometric: { direction: [0.8, 0.8, 0.8], viewUp: [0, 0, 1] }
+};
+
 const VtkViewer = () => {
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState(null);
@@ -153,44 +164,20 @@ const VtkViewer = () => {
     // Focus on the center of the object (which is now at origin due to centering)
     camera.setFocalPoint(0, 0, 0);
     
-    switch (preset) {
-      case 'front':
-        camera.setPosition(0, 0, distance);
-        camera.setViewUp(0, 1, 0);
-        break;
-      case 'back':
-        camera.setPosition(0, 0, -distance);
-        camera.setViewUp(0, 1, 0);
-        break;
-      case 'left':
-        camera.setPosition(distance, 0, 0);
-        camera.setViewUp(0, 0, 1);
-        break;
-      case 'right':
-        camera.setPosition(-distance, 0, 0);
-        camera.setViewUp(0, 0, 1);
-        break;
-      case 'top':
-        camera.setPosition(0, distance, 0);
-        camera.setViewUp(0, 0, 1);
-        break;
-      case 'bottom':
-        camera.setPosition(0, -distance, 0);
-        camera.setViewUp(0, 0, 1);
-        break;
-      case 'isometric':
-        camera.setPosition(
-          distance * 0.8,
-          distance * 0.8,
-          distance * 0.8
-        );
-        camera.setViewUp(0, 0, 1);
-        break;
-      default:
-        renderer.resetCamera();
-        return;
+    const presetConfig = CAMERA_PRESETS[preset];
+    if (!presetConfig) {
+      renderer.resetCamera();
+      return;
     }
     
+    const { direction, viewUp } = presetConfig;
+    camera.setPosition(
+      direction[0] * distance,
+      direction[1] * distance,
+      direction[2] * distance
+    );
+    camera.setViewUp(...viewUp);
+    
     camera.dolly(0.8);
     renderer.resetCameraClippingRange();
     renderWindow.render();
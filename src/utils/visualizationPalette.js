@@ -38,6 +38,9 @@ export class DataVisualizationPalette {
         description: 'Biologically-inspired color progression'
       }
     };
+
+    // Sampled colors keyed by "schemeId:resolution" (the gradients are pure)
+    this.sampleCache = new Map();
   }
 
   // Custom heat wave algorithm (blue to red with mathematical curve)
@@ -154,10 +157,22 @@ export class DataVisualizationPalette {
     return this.colorSchemes[schemeId] || this.colorSchemes['heatwave'];
   }
 
+  // Sample a scheme's gradient, reusing earlier samples of the same size
+  sampleScheme(schemeId, resolution) {
+    const key = `${schemeId}:${resolution}`;
+    let colors = this.sampleCache.get(key);
+    if (!colors) {
+      const scheme = this.getSchemeData(schemeId);
+      colors = scheme.colorFunction.call(this, resolution);
+      this.sampleCache.set(key, colors);
+    }
+    return colors;
+  }
+
   // Generate color progression for data visualization
   createColorProgression(schemeId, minValue, maxValue, resolution = 256) {
-    const scheme = this.colorSchemes[schemeId] || this.colorSchemes['heatwave'];
-    const colors = scheme.colorFunction.call(this, resolution);
+    const scheme = this.getSchemeData(schemeId);
+    const colors = this.sampleScheme(schemeId, resolution);
     
     return {
       colorData: colors,
@@ -172,11 +187,16 @@ export class DataVisualizationPalette {
     const [minVal, maxVal] = valueRange;
     const colorSet = this.createColorProgression(schemeId, minVal, maxVal, 24);
     
-    const vtkPoints = [];
-    colorSet.colorData.forEach((colorRGB, idx) => {
-      const dataValue = minVal + (idx / (colorSet.colorData.length - 1)) * (maxVal - minVal);
-      vtkPoints.push([dataValue, colorRGB[0], colorRGB[1], colorRGB[2]]);
-    });
+    // Evenly spaced values (linspace): hoist the step, pin the endpoint to maxVal
+    const colors = colorSet.colorData;
+    const lastIdx = colors.length - 1;
+    const step = (maxVal - minVal) / lastIdx;
+    const vtkPoints = new Array(colors.length);
+    for (let idx = 0; idx <= lastIdx; idx++) {
+      const dataValue = idx === lastIdx ? maxVal : minVal + step * idx;
+      const colorRGB = colors[idx];
+      vtkPoints[idx] = [dataValue, colorRGB[0], colorRGB[1], colorRGB[2]];
+    }
     
     return vtkPoints;
   }
@@ -186,8 +206,7 @@ export class DataVisualizationPalette {
     const [minVal, maxVal] = valueRange;
     const normalizedVal = Math.max(0, Math.min(1, (value - minVal) / (maxVal - minVal)));
     
-    const scheme = this.colorSchemes[schemeId] || this.colorSchemes['heatwave'];
-    const colors = scheme.colorFunction.call(this, 256);
+    const colors = this.sampleScheme(schemeId, 256);
     
     const colorIndex = Math.floor(normalizedVal * (colors.length - 1));
     return colors[colorIndex] || [0.5, 0.5, 0.5];
@@ -36,11 +36,14 @@ export const loadVtkFile = async (filePath) => {
     }
     
     // Read as binary ArrayBuffer and check format
-    // Decode the header (first ~100 KB) as ASCII so we can inspect meta-info quickly
-    const headerText = new TextDecoder('ascii').decode(vtkBuffer.slice(0, 100000));
+    // Decode the header (first ~100 KB) as ASCII so we can inspect meta-info quickly.
+    // A Uint8Array view avoids copying the header bytes out of the file buffer.
+    const headerBytes = new Uint8Array(vtkBuffer, 0, Math.min(vtkBuffer.byteLength, 100000));
+    const headerText = new TextDecoder('ascii').decode(headerBytes);
     const isBinary = headerText.includes('BINARY');
-    const isVTU = fileName.toLowerCase().endsWith('.vtu') || headerText.includes('<VTKFile');
-    const isXML = headerText.includes('<?xml') || headerText.includes('<VTKFile');
+    const hasVTKFileTag = headerText.includes('<VTKFile');
+    const isVTU = hasVTKFileTag || fileName.toLowerCase().endsWith('.vtu');
+    const isXML = hasVTKFileTag || headerText.includes('<?xml');
     
     console.log(`ℹ️ File detected as ${isVTU ? 'VTU (XML)' : 'VTK'} format, ${isBinary ? 'BINARY' : 'ASCII'} encoding`);
 
@@ -89,7 +92,8 @@ export const loadVtkFile = async (filePath) => {
     } else if (!isBinary) {
       // ASCII WORKFLOW (XML / Legacy PolyData)
       console.log('🔍 Attempting ASCII readers…');
-      const vtkDataText = headerText + new TextDecoder('ascii').decode(vtkBuffer.slice(headerText.length));
+      // Single-byte decode of the whole buffer: no tail copy or header+tail concat
+      const vtkDataText = new TextDecoder('ascii').decode(vtkBuffer);
 
       // Try XML reader first (for .vtp or XML style .vtk)
       const reader = vtkXMLPolyDataReader.newInstance();